@@ -1,15 +1,28 @@
 import os
 import json
 import csv
+import io
 import uuid
 import shutil
+import sys
 import logging
+import mmap
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from pathlib import Path
-from flask import Flask, request, jsonify
+import numpy as np
+import orjson
+from flask import Flask, request, stream_with_context
 from flask_cors import CORS
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Configure logging; set LOG_LEVEL=DEBUG or INFO for more detail
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "WARNING").upper()
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    LOG_LEVEL = "WARNING"
+logging.basicConfig(level=LOG_LEVEL)
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key")
@@ -21,6 +34,9 @@ CORS(app, origins=["*"])
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(exist_ok=True)
 
+# Cleared UUID directories are renamed to this prefix and deleted in the background
+TRASH_PREFIX = ".trash-"
+
 # Model names for directory creation
 MODEL_NAMES = [
     "qwen_CoT_video_image_info",
@@ -37,6 +53,75 @@ MODEL_NAMES = [
     "smol_description_info"
 ]
 
+# Set view of MODEL_NAMES for request validation; the list keeps directory order
+MODEL_NAMES_SET = frozenset(MODEL_NAMES)
+
+# Judgement labels are stored padded to a fixed width so that an override can
+# patch the label column in place
+LABEL_COLUMN = 6
+LABEL_WIDTH = 3
+
+# Fixed values used to generate sample CSVs
+_CATEGORIES = np.array(['Electronics', 'Clothing', 'Home & Garden', 'Sports', 'Books'])
+_BRANDS = np.array(['BrandA', 'BrandB', 'BrandC', 'BrandD', 'BrandE'])
+_LABELS = np.array([label.ljust(LABEL_WIDTH) for label in ('Yes', 'N/A', 'No')])
+_REASONS = (
+    'Product clearly matches criteria {}',
+    'Product information insufficient for determination {}',
+    'Product does not meet the required standards {}'
+)
+_PRODUCT_IDS = tuple(f'P{i:04d}' for i in range(1, 1001))
+_CSV_HEADERS = {
+    'video_description': ('product_id', 'description_key1', 'description_key2', 'description_key3'),
+    'product_info': ('product_id', 'brand', 'price', 'spec', 'category'),
+    'judgement': ('product_id', 'product_name', 'category', 'video_url', 'thumbnail_url',
+                  'ground_truth_image_url', 'label', 'reason')
+}
+
+# Pre-serialized bodies for fixed responses. A fresh Response is still built per
+# request because after_request hooks (CORS) add headers to the object.
+_OK_BODY = b'{"ok":true}'
+_HEALTH_BODY = orjson.dumps({'status': 'healthy', 'message': 'Video Review Pipeline API is running'})
+
+# /status bodies keyed by (uuid, model, model directory mtime), oldest first
+STATUS_CACHE_SIZE = 4096
+STATUS_CACHE_MIN_AGE_NS = 1_000_000_000
+_STATUS_CACHE = OrderedDict()
+_STATUS_CACHE_LOCK = threading.Lock()
+_PENDING_STATUS_BODY = orjson.dumps({
+    'video_description_csv': 'pending',
+    'product_info_csv': 'pending',
+    'judgement_csv': 'pending'
+})
+
+def _json_response(body, status=200):
+    """Wrap an already-serialized JSON body in a response"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
+def ojsonify(obj, status=200):
+    """Serialize an object with orjson and wrap it in a response"""
+    return _json_response(orjson.dumps(obj), status)
+
+def _ok():
+    """Return the standard success response"""
+    return _json_response(_OK_BODY)
+
+@lru_cache(maxsize=128)
+def _error_body(message, with_ok=True):
+    """Serialize an error payload once per distinct message"""
+    if with_ok:
+        return orjson.dumps({'ok': False, 'error': message})
+    return orjson.dumps({'error': message})
+
+def _error(message, status, with_ok=True):
+    """Return an error response for a fixed message"""
+    return _json_response(_error_body(message, with_ok), status)
+
+def is_valid_uuid(uuid_str):
+    """Check that a client-supplied UUID is a single, non-hidden path component"""
+    return (isinstance(uuid_str, str) and not uuid_str.startswith('.')
+            and not any(c in uuid_str for c in '/\\\0'))
+
 def get_model_dir(uuid_str, model_name):
     """Get the directory path for a specific UUID and model"""
     return DATA_DIR / uuid_str / model_name
@@ -46,171 +131,369 @@ def get_csv_path(uuid_str, model_name, csv_type):
     model_dir = get_model_dir(uuid_str, model_name)
     return model_dir / f"{csv_type}.csv"
 
-def ensure_model_dir(uuid_str, model_name):
-    """Ensure the model directory exists"""
-    model_dir = get_model_dir(uuid_str, model_name)
-    model_dir.mkdir(parents=True, exist_ok=True)
-    return model_dir
+def csv_exists(csv_path):
+    """Check whether a CSV file has already been written"""
+    try:
+        return csv_path.stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
+def make_model_dir(uuid_dir, model_name):
+    """Create a model directory directly under an existing UUID directory"""
+    try:
+        os.mkdir(uuid_dir / model_name)
+    except FileExistsError:
+        pass
+
+def run_in_background(target, *args):
+    """Run a blocking call on a native OS thread without waiting for it"""
+    # Gevent workers monkey-patch threading, which turns Thread into a greenlet
+    # that runs a blocking call to completion before start() returns
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('threading'):
+        import gevent
+        gevent.get_hub().threadpool.spawn(target, *args)
+    else:
+        threading.Thread(target=target, args=args, daemon=True).start()
+
+def discard_dir(path):
+    """Rename a directory into the trash and delete it on a background thread"""
+    trash_dir = DATA_DIR / f"{TRASH_PREFIX}{uuid.uuid4().hex}"
+    os.rename(path, trash_dir)
+    run_in_background(shutil.rmtree, trash_dir, True)
+
+def remove_trash():
+    """Delete trash directories left behind when a background delete was interrupted"""
+    for trash_dir in DATA_DIR.glob(f"{TRASH_PREFIX}*"):
+        shutil.rmtree(trash_dir, ignore_errors=True)
+
+run_in_background(remove_trash)
+
+def read_csv_buffer(filepath):
+    """Read a whole CSV file in one call and return it as an in-memory text buffer"""
+    return io.StringIO(filepath.read_bytes().decode('utf-8'))
+
+def read_csv_lookup(filepath):
+    """Read a CSV file into its column names and a product_id -> values mapping
+    
+    Values are kept as tuples that share one tuple of keys; callers build a
+    dict from them only when they emit a row.
+    """
+    reader = csv.reader(read_csv_buffer(filepath))
+    keys = tuple(next(reader, ['product_id'])[1:])
+    return keys, {row[0]: tuple(row[1:]) for row in reader if row}
+
+def lookup_row(lookup, product_id):
+    """Build the column dict for a product from a read_csv_lookup result"""
+    keys, rows = lookup
+    values = rows.get(product_id)
+    return dict(zip(keys, values)) if values is not None else {}
+
+def needs_csv_quoting(values):
+    """Check whether any value would need quoting when written as a CSV field"""
+    return any(c in value for value in values for c in ',"\r\n')
+
+# Labels and headers are written unquoted as well; they are fixed, so check them once
+assert not needs_csv_quoting(_LABELS.tolist()), "Sample labels must not need CSV quoting"
+assert not any(needs_csv_quoting(header) for header in _CSV_HEADERS.values()), \
+    "Sample CSV headers must not need CSV quoting"
+
+@lru_cache(maxsize=16)
+def sample_columns(csv_type, num_items):
+    """Build the row-independent columns of a sample CSV
+    
+    The values only depend on the row number, so each (csv_type, num_items)
+    pair is computed once and reused. Columns are returned as tuples of strings.
+    """
+    columns = _build_sample_columns(csv_type, num_items)
+    # create_sample_csv joins values without csv.writer, so none may need quoting
+    assert not any(needs_csv_quoting(column.flat if isinstance(column, np.ndarray) else column)
+                   for column in columns), f"Sample {csv_type} values must not need CSV quoting"
+    return columns
+
+def _build_sample_columns(csv_type, num_items):
+    """Compute the columns returned by sample_columns"""
+    numbers = range(1, num_items + 1)
+    index = np.arange(1, num_items + 1)
+    if num_items <= len(_PRODUCT_IDS):
+        product_ids = _PRODUCT_IDS[:num_items]
+    else:
+        product_ids = tuple(f'P{i:04d}' for i in numbers)
+    
+    if csv_type == "video_description":
+        durations = 30 + index % 60
+        qualities = np.where(index % 3 == 0, 'HD', 'Standard')
+        return (
+            product_ids,
+            tuple(f'Video shows product features {i}' for i in numbers),
+            tuple(f'Duration: {d} seconds' for d in durations.tolist()),
+            tuple(f'Quality: {q}' for q in qualities.tolist())
+        )
+    
+    if csv_type == "product_info":
+        prices = (index * 10) % 500 + 20
+        return (
+            product_ids,
+            tuple(_BRANDS[index % len(_BRANDS)].tolist()),
+            tuple(f'${p}' for p in prices.tolist()),
+            tuple(f'Model-{i}-XL' for i in numbers),
+            tuple(_CATEGORIES[index % len(_CATEGORIES)].tolist())
+        )
+    
+    if csv_type == "judgement":
+        # Every possible reason for every row, one row of the table per label
+        reasons = np.array([[template.format(i) for i in numbers] for template in _REASONS])
+        reasons.flags.writeable = False
+        return (
+            product_ids,
+            tuple(f'Sample Product {i}' for i in numbers),
+            tuple(_CATEGORIES[index % len(_CATEGORIES)].tolist()),
+            tuple(f'http://example.com/video{i}.mp4' for i in numbers),
+            tuple(f'http://example.com/thumb{i}.jpg' for i in numbers),
+            tuple(f'http://example.com/gt{i}.jpg' for i in numbers),
+            reasons
+        )
+    
+    raise ValueError(f"Unknown CSV type: {csv_type}")
 
 def create_sample_csv(filepath, csv_type, num_items=50):
     """Create a sample CSV file with realistic structure"""
     filepath.parent.mkdir(parents=True, exist_ok=True)
+    header = _CSV_HEADERS[csv_type]
+    columns = sample_columns(csv_type, num_items)
     
-    if csv_type == "video_description":
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['product_id', 'description_key1', 'description_key2', 'description_key3'])
-            for i in range(1, num_items + 1):
-                writer.writerow([
-                    f'P{i:04d}',
-                    f'Video shows product features {i}',
-                    f'Duration: {30 + i % 60} seconds',
-                    f'Quality: {"HD" if i % 3 == 0 else "Standard"}'
-                ])
+    if csv_type == "judgement":
+        *fixed, reasons = columns
+        # Draw label indices in one call; they select both the label and its reason
+        label_idx = np.random.default_rng().integers(0, len(_LABELS), size=num_items)
+        columns = (*fixed, _LABELS[label_idx].tolist(), reasons[label_idx, np.arange(num_items)].tolist())
+    
+    # Sample values never need quoting (sample_columns checks this), so rows are
+    # joined directly rather than going through csv.writer and written in one call
+    lines = [','.join(header)]
+    lines.extend(map(','.join, zip(*columns)))
+    lines.append('')
+    filepath.write_bytes('\r\n'.join(lines).encode('utf-8'))
+
+def patch_label_in_place(judgement_path, product_id, new_label):
+    """Overwrite one row's label in the judgement CSV without rewriting the file
+    
+    Returns False if the row is missing, the product_id could not be matched
+    safely as a bare field, or the label field is not stored at LABEL_WIDTH,
+    in which case the caller has to rewrite the file instead.
+    """
+    if not isinstance(product_id, str) or any(c in product_id for c in ',"\r\n'):
+        return False
+    key = product_id.encode('utf-8')
+    
+    with open(judgement_path, 'r+b') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0) as mm:
+            return _patch_label(mm, key, new_label)
+
+def _patch_label(mm, key, new_label):
+    """Patch the label of the row whose first field is key in a mapped judgement CSV
+    
+    key must not contain ',', '"', CR or LF, so a match on '\\n<key>,' is always
+    the whole first field of a line.
+    """
+    line_start = mm.find(b'\n' + key + b',')
+    if line_start == -1:
+        return False
+    line_start += 1
+    line_end = mm.find(b'\n', line_start)
+    if line_end == -1:
+        line_end = len(mm)
+    
+    # Walk to the label column by counting commas
+    field_start = line_start
+    for _ in range(LABEL_COLUMN):
+        field_start = mm.find(b',', field_start, line_end) + 1
+        if field_start == 0:
+            return False
+    field_end = mm.find(b',', field_start, line_end)
+    if field_end - field_start != LABEL_WIDTH or b'"' in mm[line_start:field_end]:
+        return False
     
-    elif csv_type == "product_info":
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['product_id', 'brand', 'price', 'spec', 'category'])
-            categories = ['Electronics', 'Clothing', 'Home & Garden', 'Sports', 'Books']
-            brands = ['BrandA', 'BrandB', 'BrandC', 'BrandD', 'BrandE']
-            for i in range(1, num_items + 1):
-                writer.writerow([
-                    f'P{i:04d}',
-                    brands[i % len(brands)],
-                    f'${(i * 10) % 500 + 20}',
-                    f'Model-{i}-XL',
-                    categories[i % len(categories)]
-                ])
+    mm[field_start:field_end] = new_label.ljust(LABEL_WIDTH).encode('utf-8')
+    mm.flush()
+    return True
+
+def stream_results(judgement_buffer, video_descriptions, product_infos):
+    """Yield the /results JSON document one judgement row at a time"""
+    label_counts = {'Yes': 0, 'N/A': 0, 'No': 0}
+    
+    yield b'{"items":['
+    # Judgement columns are fixed, so rows are read positionally
+    reader = csv.reader(judgement_buffer)
+    next(reader, None)
+    separator = b''
+    for row in reader:
+        # Skip blank or truncated lines, as csv.DictReader did for blank ones
+        if len(row) < len(_CSV_HEADERS['judgement']):
+            continue
+        product_id = row[0]
+        label = row[LABEL_COLUMN].rstrip()
+        
+        item = {
+            'product_id': product_id,
+            'product_name': row[1],
+            'category': row[2],
+            'video_url': row[3],
+            'thumbnail_url': row[4],
+            'ground_truth_image_url': row[5],
+            'label': label,
+            'reason': row[7],
+            'video_description': lookup_row(video_descriptions, product_id),
+            'product_info': lookup_row(product_infos, product_id)
+        }
+        
+        yield separator + orjson.dumps(item)
+        separator = b','
+        if label in label_counts:
+            label_counts[label] += 1
     
-    elif csv_type == "judgement":
-        import random
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['product_id', 'product_name', 'category', 'video_url', 'thumbnail_url', 
-                           'ground_truth_image_url', 'label', 'reason'])
+    yield b'],"counts":' + orjson.dumps(label_counts) + b'}'
+
+def gzip_stream(chunks):
+    """Compress an iterable of byte chunks into a gzip stream"""
+    # Level 1 trades a little ratio for speed; the JSON repeats heavily anyway
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def requires(*fields, model_required=False, optional=None):
+    """Parse the JSON body once and pass the named fields to the view
+    
+    Responds with 400 if the body is not a JSON object, if any field is missing
+    or empty, if 'uuid' is not a valid directory name (see is_valid_uuid), or,
+    with model_required, if 'model' is not a known model name.
+    optional maps further field names to their required type; those fields
+    are passed as keyword arguments when present, and a value of any other
+    type is a 400.
+    """
+    optional = optional or {}
+    if len(fields) <= 2:
+        missing_message = f"Missing {' or '.join(fields)}"
+    else:
+        missing_message = 'Missing required parameters'
+    uuid_index = fields.index('uuid') if 'uuid' in fields else None
+    model_index = fields.index('model') if model_required else None
+    
+    def decorator(view):
+        @wraps(view)
+        def wrapper():
+            try:
+                data = orjson.loads(request.get_data() or b'{}')
+            except orjson.JSONDecodeError:
+                return _error('Invalid JSON body', 400)
+            if not isinstance(data, dict):
+                return _error('Invalid JSON body', 400)
+            
+            values = [data.get(field) for field in fields]
+            if not all(values):
+                return _error(missing_message, 400)
             
-            labels = ['Yes', 'N/A', 'No']
-            categories = ['Electronics', 'Clothing', 'Home & Garden', 'Sports', 'Books']
+            if uuid_index is not None and not is_valid_uuid(values[uuid_index]):
+                return _error('Invalid uuid', 400)
             
-            for i in range(1, num_items + 1):
-                label = random.choice(labels)
-                reasons = {
-                    'Yes': f'Product clearly matches criteria {i}',
-                    'N/A': f'Product information insufficient for determination {i}',
-                    'No': f'Product does not meet the required standards {i}'
-                }
-                
-                writer.writerow([
-                    f'P{i:04d}',
-                    f'Sample Product {i}',
-                    categories[i % len(categories)],
-                    f'http://example.com/video{i}.mp4',
-                    f'http://example.com/thumb{i}.jpg',
-                    f'http://example.com/gt{i}.jpg',
-                    label,
-                    reasons[label]
-                ])
+            if model_index is not None:
+                model = values[model_index]
+                if not isinstance(model, str) or model not in MODEL_NAMES_SET:
+                    return _error('Invalid model name', 400)
+            
+            extras = {field: data[field] for field in optional if field in data}
+            for field, value in extras.items():
+                if not isinstance(value, optional[field]):
+                    return _error(f"{field} must be a {optional[field].__name__}", 400)
+            return view(*values, **extras)
+        return wrapper
+    return decorator
 
 @app.route('/pull_data', methods=['POST'])
-def pull_data():
+@requires('uuid', 'days_back')
+def pull_data(uuid_str, days_back):
     """Pull data endpoint - simulates data collection"""
     try:
-        data = request.get_json()
-        uuid_str = data.get('uuid')
-        days_back = data.get('days_back')
-        
-        if not uuid_str or not days_back:
-            return jsonify({'ok': False, 'error': 'Missing uuid or days_back'}), 400
-        
         if not isinstance(days_back, int) or days_back < 1:
-            return jsonify({'ok': False, 'error': 'days_back must be a positive integer'}), 400
+            return _error('days_back must be a positive integer', 400)
         
-        # Create directories for all models
+        # Create the UUID directory once, then each model directory directly under it
+        uuid_dir = DATA_DIR / uuid_str
+        uuid_dir.mkdir(parents=True, exist_ok=True)
         for model_name in MODEL_NAMES:
-            ensure_model_dir(uuid_str, model_name)
+            make_model_dir(uuid_dir, model_name)
         
-        app.logger.info(f"Data pull completed for UUID {uuid_str}, {days_back} days back")
-        return jsonify({'ok': True})
+        app.logger.info("Data pull completed for UUID %s, %d days back", uuid_str, days_back)
+        return _ok()
         
     except Exception as e:
-        app.logger.error(f"Error in pull_data: {str(e)}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        app.logger.error("Error in pull_data: %s", e)
+        return ojsonify({'ok': False, 'error': str(e)}, 500)
 
 @app.route('/make_video_description', methods=['POST'])
-def make_video_description():
+@requires('uuid', 'model', model_required=True, optional={'force': bool})
+def make_video_description(uuid_str, model, force=False):
     """Generate video descriptions"""
     try:
-        data = request.get_json()
-        uuid_str = data.get('uuid')
-        model = data.get('model')
-        
-        if not uuid_str or not model:
-            return jsonify({'ok': False, 'error': 'Missing uuid or model'}), 400
-        
-        if model not in MODEL_NAMES:
-            return jsonify({'ok': False, 'error': 'Invalid model name'}), 400
+        csv_path = get_csv_path(uuid_str, model, 'video_description')
+        if not force and csv_exists(csv_path):
+            app.logger.debug("Video description CSV already exists for UUID %s, model %s", uuid_str, model)
+            return _ok()
         
         # Create the CSV file
-        csv_path = get_csv_path(uuid_str, model, 'video_description')
         create_sample_csv(csv_path, 'video_description')
         
-        app.logger.info(f"Video description CSV created for UUID {uuid_str}, model {model}")
-        return jsonify({'ok': True})
+        app.logger.info("Video description CSV created for UUID %s, model %s", uuid_str, model)
+        return _ok()
         
     except Exception as e:
-        app.logger.error(f"Error in make_video_description: {str(e)}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        app.logger.error("Error in make_video_description: %s", e)
+        return ojsonify({'ok': False, 'error': str(e)}, 500)
 
 @app.route('/make_product_info', methods=['POST'])
-def make_product_info():
+@requires('uuid', 'model', model_required=True, optional={'force': bool})
+def make_product_info(uuid_str, model, force=False):
     """Generate product information"""
     try:
-        data = request.get_json()
-        uuid_str = data.get('uuid')
-        model = data.get('model')
-        
-        if not uuid_str or not model:
-            return jsonify({'ok': False, 'error': 'Missing uuid or model'}), 400
-        
-        if model not in MODEL_NAMES:
-            return jsonify({'ok': False, 'error': 'Invalid model name'}), 400
+        csv_path = get_csv_path(uuid_str, model, 'product_info')
+        if not force and csv_exists(csv_path):
+            app.logger.debug("Product info CSV already exists for UUID %s, model %s", uuid_str, model)
+            return _ok()
         
         # Create the CSV file
-        csv_path = get_csv_path(uuid_str, model, 'product_info')
         create_sample_csv(csv_path, 'product_info')
         
-        app.logger.info(f"Product info CSV created for UUID {uuid_str}, model {model}")
-        return jsonify({'ok': True})
+        app.logger.info("Product info CSV created for UUID %s, model %s", uuid_str, model)
+        return _ok()
         
     except Exception as e:
-        app.logger.error(f"Error in make_product_info: {str(e)}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        app.logger.error("Error in make_product_info: %s", e)
+        return ojsonify({'ok': False, 'error': str(e)}, 500)
 
 @app.route('/judge', methods=['POST'])
-def judge():
+@requires('uuid', 'model', model_required=True, optional={'force': bool})
+def judge(uuid_str, model, force=False):
     """Run judgement process"""
     try:
-        data = request.get_json()
-        uuid_str = data.get('uuid')
-        model = data.get('model')
-        
-        if not uuid_str or not model:
-            return jsonify({'ok': False, 'error': 'Missing uuid or model'}), 400
-        
-        if model not in MODEL_NAMES:
-            return jsonify({'ok': False, 'error': 'Invalid model name'}), 400
+        csv_path = get_csv_path(uuid_str, model, 'judgement')
+        if not force and csv_exists(csv_path):
+            app.logger.debug("Judgement CSV already exists for UUID %s, model %s", uuid_str, model)
+            return _ok()
         
         # Create the CSV file
-        csv_path = get_csv_path(uuid_str, model, 'judgement')
         create_sample_csv(csv_path, 'judgement')
         
-        app.logger.info(f"Judgement CSV created for UUID {uuid_str}, model {model}")
-        return jsonify({'ok': True})
+        app.logger.info("Judgement CSV created for UUID %s, model %s", uuid_str, model)
+        return _ok()
         
     except Exception as e:
-        app.logger.error(f"Error in judge: {str(e)}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        app.logger.error("Error in judge: %s", e)
+        return ojsonify({'ok': False, 'error': str(e)}, 500)
 
 @app.route('/status', methods=['GET'])
 def get_status():
@@ -220,27 +503,56 @@ def get_status():
         model = request.args.get('model')
         
         if not uuid_str or not model:
-            return jsonify({'error': 'Missing uuid or model'}), 400
-        
-        if model not in MODEL_NAMES:
-            return jsonify({'error': 'Invalid model name'}), 400
-        
-        # Check if CSV files exist
-        video_desc_path = get_csv_path(uuid_str, model, 'video_description')
-        product_info_path = get_csv_path(uuid_str, model, 'product_info')
-        judgement_path = get_csv_path(uuid_str, model, 'judgement')
+            return _error('Missing uuid or model', 400, with_ok=False)
+        
+        if not is_valid_uuid(uuid_str):
+            return _error('Invalid uuid', 400, with_ok=False)
+        
+        if model not in MODEL_NAMES_SET:
+            return _error('Invalid model name', 400, with_ok=False)
+        
+        # A model directory only changes mtime when files are added or removed,
+        # so its mtime is enough to tell whether a cached status is still valid
+        try:
+            mtime = get_model_dir(uuid_str, model).stat().st_mtime_ns
+        except FileNotFoundError:
+            return _json_response(_PENDING_STATUS_BODY)
+        
+        key = (uuid_str, model, mtime)
+        with _STATUS_CACHE_LOCK:
+            body = _STATUS_CACHE.get(key)
+            if body is not None:
+                _STATUS_CACHE.move_to_end(key)
+        if body is not None:
+            return _json_response(body)
+        
+        # Check which CSV files exist with a single directory listing
+        try:
+            with os.scandir(get_model_dir(uuid_str, model)) as entries:
+                names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            names = set()
         
         status = {
-            'video_description_csv': 'complete' if video_desc_path.exists() else 'pending',
-            'product_info_csv': 'complete' if product_info_path.exists() else 'pending',
-            'judgement_csv': 'complete' if judgement_path.exists() else 'pending'
+            'video_description_csv': 'complete' if 'video_description.csv' in names else 'pending',
+            'product_info_csv': 'complete' if 'product_info.csv' in names else 'pending',
+            'judgement_csv': 'complete' if 'judgement.csv' in names else 'pending'
         }
+        body = orjson.dumps(status)
+        
+        # Skip caching while the mtime is recent: a file created within the same
+        # timestamp tick would leave the mtime unchanged
+        if time.time_ns() - mtime > STATUS_CACHE_MIN_AGE_NS:
+            with _STATUS_CACHE_LOCK:
+                _STATUS_CACHE[key] = body
+                if len(_STATUS_CACHE) > STATUS_CACHE_SIZE:
+                    _STATUS_CACHE.popitem(last=False)
         
-        return jsonify(status)
+        return _json_response(body)
         
     except Exception as e:
-        app.logger.error(f"Error in get_status: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        app.logger.error("Error in get_status: %s", e)
+        return ojsonify({'error': str(e)}, 500)
 
 @app.route('/results', methods=['GET'])
 def get_results():
@@ -250,10 +562,13 @@ def get_results():
         model = request.args.get('model')
         
         if not uuid_str or not model:
-            return jsonify({'error': 'Missing uuid or model'}), 400
+            return _error('Missing uuid or model', 400, with_ok=False)
+        
+        if not is_valid_uuid(uuid_str):
+            return _error('Invalid uuid', 400, with_ok=False)
         
-        if model not in MODEL_NAMES:
-            return jsonify({'error': 'Invalid model name'}), 400
+        if model not in MODEL_NAMES_SET:
+            return _error('Invalid model name', 400, with_ok=False)
         
         # Read CSV files
         video_desc_path = get_csv_path(uuid_str, model, 'video_description')
@@ -261,94 +576,55 @@ def get_results():
         judgement_path = get_csv_path(uuid_str, model, 'judgement')
         
         if not all([video_desc_path.exists(), product_info_path.exists(), judgement_path.exists()]):
-            return jsonify({'error': 'Not all required CSV files exist'}), 400
-        
-        # Read video descriptions
-        video_descriptions = {}
-        with open(video_desc_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                product_id = row['product_id']
-                video_descriptions[product_id] = {k: v for k, v in row.items() if k != 'product_id'}
-        
-        # Read product info
-        product_infos = {}
-        with open(product_info_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                product_id = row['product_id']
-                product_infos[product_id] = {k: v for k, v in row.items() if k != 'product_id'}
-        
-        # Read judgement data
-        items = []
-        label_counts = {'Yes': 0, 'N/A': 0, 'No': 0}
-        
-        with open(judgement_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                product_id = row['product_id']
-                label = row['label']
-                
-                item = {
-                    'product_id': product_id,
-                    'product_name': row['product_name'],
-                    'category': row['category'],
-                    'video_url': row['video_url'],
-                    'thumbnail_url': row['thumbnail_url'],
-                    'ground_truth_image_url': row['ground_truth_image_url'],
-                    'label': label,
-                    'reason': row['reason'],
-                    'video_description': video_descriptions.get(product_id, {}),
-                    'product_info': product_infos.get(product_id, {})
-                }
-                
-                items.append(item)
-                if label in label_counts:
-                    label_counts[label] += 1
-        
-        result = {
-            'counts': label_counts,
-            'items': items
-        }
-        
-        return jsonify(result)
+            return _error('Not all required CSV files exist', 400, with_ok=False)
+        
+        # Read video descriptions and product info into per-product lookups
+        video_descriptions = read_csv_lookup(video_desc_path)
+        product_infos = read_csv_lookup(product_info_path)
+        
+        # Read the judgement file here so I/O errors still reach the handler below,
+        # then stream its rows to the client as they are parsed
+        judgement_buffer = read_csv_buffer(judgement_path)
+        body = stream_results(judgement_buffer, video_descriptions, product_infos)
+        headers = {'Vary': 'Accept-Encoding'}
+        if request.accept_encodings['gzip'] > 0:
+            body = gzip_stream(body)
+            headers['Content-Encoding'] = 'gzip'
+        return app.response_class(stream_with_context(body), mimetype='application/json', headers=headers)
         
     except Exception as e:
-        app.logger.error(f"Error in get_results: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        app.logger.error("Error in get_results: %s", e)
+        return ojsonify({'error': str(e)}, 500)
 
 @app.route('/override_label', methods=['POST'])
-def override_label():
+@requires('uuid', 'model', 'product_id', 'new_label', model_required=True)
+def override_label(uuid_str, model, product_id, new_label):
     """Override a product label in the judgement CSV"""
     try:
-        data = request.get_json()
-        uuid_str = data.get('uuid')
-        model = data.get('model')
-        product_id = data.get('product_id')
-        new_label = data.get('new_label')
-        
-        if not all([uuid_str, model, product_id, new_label]):
-            return jsonify({'ok': False, 'error': 'Missing required parameters'}), 400
-        
-        if model not in MODEL_NAMES:
-            return jsonify({'ok': False, 'error': 'Invalid model name'}), 400
+        if not isinstance(product_id, str) or not isinstance(new_label, str):
+            return _error('product_id and new_label must be strings', 400)
         
         if new_label not in ['Yes', 'N/A', 'No']:
-            return jsonify({'ok': False, 'error': 'Invalid label'}), 400
+            return _error('Invalid label', 400)
         
         judgement_path = get_csv_path(uuid_str, model, 'judgement')
         
         if not judgement_path.exists():
-            return jsonify({'ok': False, 'error': 'Judgement CSV not found'}), 400
+            return _error('Judgement CSV not found', 400)
+        
+        # Patch the label bytes in place; fall back to rewriting the whole file
+        # for rows that are not in the fixed-width layout
+        if patch_label_in_place(judgement_path, product_id, new_label):
+            app.logger.info("Label override completed for product %s to %s", product_id, new_label)
+            return _ok()
         
         # Read existing data
         rows = []
-        with open(judgement_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['product_id'] == product_id:
-                    row['label'] = new_label
-                rows.append(row)
+        reader = csv.DictReader(read_csv_buffer(judgement_path))
+        for row in reader:
+            if row['product_id'] == product_id:
+                row['label'] = new_label.ljust(LABEL_WIDTH)
+            rows.append(row)
         
         # Write back the updated data
         if rows:
@@ -358,34 +634,29 @@ def override_label():
                 writer.writeheader()
                 writer.writerows(rows)
         
-        app.logger.info(f"Label override completed for product {product_id} to {new_label}")
-        return jsonify({'ok': True})
+        app.logger.info("Label override completed for product %s to %s", product_id, new_label)
+        return _ok()
         
     except Exception as e:
-        app.logger.error(f"Error in override_label: {str(e)}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        app.logger.error("Error in override_label: %s", e)
+        return ojsonify({'ok': False, 'error': str(e)}, 500)
 
 @app.route('/clear', methods=['POST'])
-def clear_all():
+@requires('uuid')
+def clear_all(uuid_str):
     """Clear all data for a UUID across all models"""
     try:
-        data = request.get_json()
-        uuid_str = data.get('uuid')
-        
-        if not uuid_str:
-            return jsonify({'ok': False, 'error': 'Missing uuid'}), 400
-        
-        # Remove the entire UUID directory
+        # Move the entire UUID directory out of the way and delete it in the background
         uuid_dir = DATA_DIR / uuid_str
         if uuid_dir.exists():
-            shutil.rmtree(uuid_dir)
-            app.logger.info(f"Cleared all data for UUID {uuid_str}")
+            discard_dir(uuid_dir)
+            app.logger.info("Cleared all data for UUID %s", uuid_str)
         
-        return jsonify({'ok': True})
+        return _ok()
         
     except Exception as e:
-        app.logger.error(f"Error in clear_all: {str(e)}")
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        app.logger.error("Error in clear_all: %s", e)
+        return ojsonify({'ok': False, 'error': str(e)}, 500)
 
 @app.route('/')
 def index():
@@ -395,7 +666,7 @@ def index():
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'message': 'Video Review Pipeline API is running'})
+    return _json_response(_HEALTH_BODY)
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
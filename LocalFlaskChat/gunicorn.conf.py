@@ -0,0 +1,10 @@
+"""Gunicorn settings for serving the API with gevent workers
+
+Run from this directory with: gunicorn -c gunicorn.conf.py main:app
+"""
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+worker_connections = 1000